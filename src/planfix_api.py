@@ -1,7 +1,7 @@
 """Planfix API client."""
 
 import logging
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Union, Type, TypeVar
 from pydantic import BaseModel, ValidationError
 
 import httpx
@@ -42,6 +42,14 @@ class PlanfixValidationError(PlanfixError):
     pass
 
 
+# HTTP status codes that map to a dedicated exception and message
+HTTP_ERRORS: Dict[int, Tuple[Type[PlanfixError], str]] = {
+    401: (PlanfixAuthError, "Неверные учётные данные API"),
+    403: (PlanfixAuthError, "Недостаточно прав доступа"),
+    404: (PlanfixNotFoundError, "Ресурс не найден"),
+}
+
+
 class PlanfixAPI:
     """Planfix API client with comprehensive model support."""
     
@@ -78,35 +86,37 @@ class PlanfixAPI:
                 
                 log_api_call(method, endpoint, response.status_code)
                 
-                # Handle different response codes
-                if response.status_code == 401:
-                    raise PlanfixAuthError("Неверные учётные данные API")
-                elif response.status_code == 403:
-                    raise PlanfixAuthError("Недостаточно прав доступа")
-                elif response.status_code == 404:
-                    raise PlanfixNotFoundError("Ресурс не найден")
-                elif response.status_code >= 400:
-                    error_data = response.text
-                    try:
-                        error_json = response.json()
-                        if "result" in error_json and error_json["result"] == "fail":
-                            # Try to parse as ApiResponseError
-                            try:
-                                error_obj = ApiResponseError(**error_json)
-                                raise PlanfixError(f"API Error {error_obj.code}: {error_obj.error}")
-                            except ValidationError:
-                                pass
-                        error_data = error_json.get("message", error_json.get("error", error_data))
-                    except:
-                        pass
-                    raise PlanfixError(f"HTTP {response.status_code}: {error_data}")
+                # Successful responses are the common case, check them first
+                if response.status_code < 400:
+                    return response.json()
+                
+                # Handle different error codes
+                known_error = HTTP_ERRORS.get(response.status_code)
+                if known_error:
+                    error_class, message = known_error
+                    raise error_class(message)
                 
-                return response.json()
+                error_data = response.text
+                try:
+                    error_json = response.json()
+                    if "result" in error_json and error_json["result"] == "fail":
+                        # Try to parse as ApiResponseError
+                        try:
+                            error_obj = ApiResponseError(**error_json)
+                            raise PlanfixError(f"API Error {error_obj.code}: {error_obj.error}")
+                        except ValidationError:
+                            pass
+                    error_data = error_json.get("message", error_json.get("error", error_data))
+                except:
+                    pass
+                raise PlanfixError(f"HTTP {response.status_code}: {error_data}")
                 
         except httpx.TimeoutException:
             raise PlanfixError("Превышено время ожидания запроса")
         except httpx.ConnectError:
             raise PlanfixError("Не удалось подключиться к Planfix API")
+        except PlanfixError:
+            raise
         except Exception as e:
             logger.error(f"API request failed: {e}")
             raise PlanfixError(f"Ошибка API запроса: {e}")
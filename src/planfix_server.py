@@ -10,20 +10,25 @@ Planfix MCP Server
 """
 
 import argparse
-import json
+import functools
+import importlib.util
 import logging
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Any, AsyncIterator, Dict, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from .config import config
-from .planfix_api import PlanfixAPI, PlanfixError, PlanfixValidationError
+from .planfix_api import PlanfixAPI, PlanfixValidationError
 from .utils import (
+    dump_json,
     format_date,
     format_error,
+    truncate_text,
 )
 
 # ============================================================================
@@ -43,6 +48,10 @@ class PaginationMixin(BaseModel):
         return self.offset
 
 
+TASK_LIST_STATUS_CHOICES = ('active', 'completed', 'all')
+TASK_LIST_STATUSES = frozenset(TASK_LIST_STATUS_CHOICES)
+
+
 class TaskListRequest(PaginationMixin):
     """
     Validation model for task list parameters with pagination and filters.
@@ -54,9 +63,8 @@ class TaskListRequest(PaginationMixin):
     @field_validator('status')
     @classmethod
     def validate_status(cls, v: str) -> str:
-        allowed_statuses = ['active', 'completed', 'all']
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
+        if v not in TASK_LIST_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(TASK_LIST_STATUS_CHOICES)}")
         return v
 
 
@@ -120,6 +128,11 @@ class CommentListRequest(PaginationMixin):
 # ============================================================================
 
 T = TypeVar('T', bound=BaseModel)
+R = TypeVar('R')
+
+# Shown in place of a missing contact name
+NO_NAME = "Без имени"
+
 
 def validate_input(data: Dict[str, Any], model_class: type[T]) -> T:
     """Validate input data against a Pydantic model."""
@@ -128,15 +141,69 @@ def validate_input(data: Dict[str, Any], model_class: type[T]) -> T:
     except ValidationError as e:
         error_details: List[str] = []
         for error in e.errors():
-            field = " -> ".join(str(x) for x in error['loc'])
+            field = " -> ".join([str(x) for x in error['loc']])
             message = error['msg']
             error_details.append(f"Поле '{field}': {message}")
         
         raise PlanfixValidationError(f"Ошибка валидации входных данных:\n" + "\n".join(error_details))
 
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG if config.debug else logging.INFO)
+def paginated_result(items: List[Any], request: PaginationMixin, noun: str, filter_str: str = "") -> str:
+    """Serialize a page of list results and append pagination info."""
+    if not items:
+        return f"[]\n\nВсего найдено: 0 {noun}{filter_str}"
+
+    result = dump_json(items)
+    if len(items) >= request.limit:
+        result += f"\n\nПоказаны {len(items)} результатов{filter_str} (лимит: {request.limit})"
+        if request.page:
+            result += f", страница {request.page}"
+        else:
+            result += f", смещение {request.get_offset()}"
+        result += ". Используйте параметры offset/page для получения следующих результатов."
+    else:
+        result += f"\n\nВсего найдено: {len(items)} {noun}{filter_str}"
+    return result
+
+
+def numbered_list(title: str, items: Sequence[R], render_item: Callable[[R], str]) -> str:
+    """Render records as a numbered list under a header with the item count.
+
+    ``render_item`` returns the record's title line followed by its detail
+    lines; records are separated by a blank line.
+    """
+    parts = [f"{title} ({len(items)} шт.)\n\n"]
+    append = parts.append
+    for i, item in enumerate(items, 1):
+        append(f"{i}. {render_item(item)}\n")
+    return "".join(parts).strip()
+
+
+ToolHandler = Callable[..., Awaitable[str]]
+
+def tool_errors(action: str) -> Callable[[ToolHandler], ToolHandler]:
+    """Turn exceptions raised by an MCP tool into a user-facing error message.
+
+    `action` completes the phrase "ошибка при ...", e.g. "поиске задач".
+    """
+    def decorator(func: ToolHandler) -> ToolHandler:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await func(*args, **kwargs)
+            except PlanfixValidationError as e:
+                logger.error(f"Ошибка валидации при {action}: {e}")
+                return str(e)
+            except Exception as e:
+                logger.error(f"Ошибка при {action}: {e}")
+                return format_error(e, action)
+        return wrapper
+    return decorator
+
+
+# Configure logging, unless the host application already did
+if not logging.getLogger().hasHandlers():
+    logging.basicConfig(level=logging.DEBUG if config.debug else logging.INFO)
 logger = logging.getLogger(__name__)
 api = None
 
@@ -195,6 +262,7 @@ mcp = FastMCP(
 # ============================================================================
 
 @mcp.tool()
+@tool_errors("поиске задач")
 async def list_tasks(
     project_id: Optional[int] = None,
     assignee_id: Optional[int] = None,
@@ -255,61 +323,35 @@ async def list_tasks(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters with pagination support
-        request_data = {
-            "project_id": project_id,
-            "assignee_id": assignee_id,
-            "status": status,
-            "offset": offset,
-            "limit": limit,
-            "page": page
-        }
-        validated_request = validate_input(request_data, TaskListRequest)
-        
-        logger.info(f"Список задач: status='{validated_request.status}', offset={validated_request.get_offset()}, limit={validated_request.limit}")
-        
-        if api is None:
-            return "API не инициализирован"
-        
-        # Search tasks via API using validated parameters
-        tasks = await api.list_tasks(
-            project_id=validated_request.project_id,
-            assignee_id=validated_request.assignee_id,
-            status=validated_request.status,
-            limit=validated_request.limit,
-            offset=validated_request.get_offset()
-        )
-        
-        # Format and return results
-        result = json.dumps([task.model_dump() for task in tasks], indent=2, ensure_ascii=False)
-        
-        # Add pagination info
-        if len(tasks) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(tasks)} результатов (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(tasks)} задач(и)"
-            
-        logger.info(f"Найдено задач: {len(tasks)}")
-        return result
+    # Validate input parameters with pagination support
+    request_data = {
+        "project_id": project_id,
+        "assignee_id": assignee_id,
+        "status": status,
+        "offset": offset,
+        "limit": limit,
+        "page": page
+    }
+    validated_request = validate_input(request_data, TaskListRequest)
+    
+    logger.info(f"Список задач: status='{validated_request.status}', offset={validated_request.get_offset()}, limit={validated_request.limit}")
+    
+    if api is None:
+        return "API не инициализирован"
+    
+    # Search tasks via API using validated parameters
+    tasks = await api.list_tasks(
+        project_id=validated_request.project_id,
+        assignee_id=validated_request.assignee_id,
+        status=validated_request.status,
+        limit=validated_request.limit,
+        offset=validated_request.get_offset()
+    )
+    
+    result = paginated_result(tasks, validated_request, "задач(и)")
         
-    except PlanfixValidationError as e:
-        error_msg = f"Ошибка валидации: {str(e)}"
-        logger.error(f"Ошибка валидации поиска задач: {e}")
-        return error_msg
-    except PlanfixError as e:
-        error_msg = format_error(e, "поиске задач")
-        logger.error(f"Ошибка поиска задач: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "поиске задач")
-        logger.error(f"Unexpected error searching tasks: {e}")
-        return error_msg
+    logger.info(f"Найдено задач: {len(tasks)}")
+    return result
 
 # Removed update_task_status - read-only scope
 
@@ -323,6 +365,7 @@ async def list_tasks(
 # ============================================================================
 
 @mcp.tool()
+@tool_errors("поиске контактов")
 async def list_contacts(
     offset: int = 0,
     limit: int = 20,
@@ -342,52 +385,32 @@ async def list_contacts(
     Example:
         list_contacts(10)
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page,
-            "is_company": is_company
-        }
-        validated_request = validate_input(request_data, ContactListRequest)
-        
-        logger.info(f"Список контактов: is_company={validated_request.is_company}")
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page,
+        "is_company": is_company
+    }
+    validated_request = validate_input(request_data, ContactListRequest)
+    
+    logger.info(f"Список контактов: is_company={validated_request.is_company}")
+    
+    if api is None:
+        return "API не инициализирован"
         
-        if api is None:
-            return "API не инициализирован"
-            
-        contacts = await api.list_contacts(
-            limit=validated_request.limit,
-            offset=validated_request.get_offset(),
-            is_company=validated_request.is_company
-        )
-        result = json.dumps([contact.model_dump() for contact in contacts], indent=2, ensure_ascii=False)
-
-        # Add pagination info
-        if len(contacts) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(contacts)} результатов (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(contacts)} контакт(ов)"
+    contacts = await api.list_contacts(
+        limit=validated_request.limit,
+        offset=validated_request.get_offset(),
+        is_company=validated_request.is_company
+    )
+    result = paginated_result(contacts, validated_request, "контакт(ов)")
 
-        logger.info(f"Найдено контактов: {len(contacts)}")
-        return result
-        
-    except PlanfixValidationError as e:
-        error_msg = f"Ошибка валидации: {str(e)}"
-        logger.error(f"Ошибка валидации поиска контактов: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "поиске контактов")
-        logger.error(f"Unexpected error searching contacts: {e}")
-        return error_msg
+    logger.info(f"Найдено контактов: {len(contacts)}")
+    return result
 
 @mcp.tool()
+@tool_errors("получении контакта")
 async def get_contact_details(contact_id: int) -> str:
     """
     Retrieve comprehensive details for a specific contact by ID.
@@ -443,120 +466,100 @@ async def get_contact_details(contact_id: int) -> str:
         PlanfixNotFoundError: Contact with specified ID not found
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {"contact_id": contact_id}
-        validated_request = validate_input(request_data, ContactDetailsRequest)
-        
-        logger.info(f"Получение деталей контакта: {validated_request.contact_id}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        contact = await api.get_contact_details(validated_request.contact_id)
-        
-        # Format single contact as detailed view
-        name = contact.name or "Без имени"
-        midname = contact.midname or ""
-        lastname = contact.lastname or ""
-        full_name = f"{name} {midname} {lastname}".strip()
-        
-        result = f"Контакт #{contact.id}\n\n"
-        result += f"Имя: {full_name}\n"
-        
-        if contact.email:
-            result += f"Email: {contact.email}\n"
-        if contact.phone:
-            result += f"Телефон: {contact.phone}\n"
-        if contact.company:
-            result += f"Компания: {contact.company}\n"
-        if contact.position:
-            result += f"Должность: {contact.position}\n"
-        if contact.description:
-            result += f"Описание: {contact.description}\n"  # Full description, not truncated
-        if contact.is_company:
-            result += f"Тип: Компания\n"
-        if contact.created_date:
-            result += f"Создан: {format_date(contact.created_date)}\n"
-        
-        result += f"\nПолная детальная информация о контакте ID {contact.id}"
-        return result
+    # Validate input parameters
+    request_data = {"contact_id": contact_id}
+    validated_request = validate_input(request_data, ContactDetailsRequest)
+    
+    logger.info(f"Получение деталей контакта: {validated_request.contact_id}")
+    
+    if api is None:
+        return "API не инициализирован"
         
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения контакта: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении контакта")
-        logger.error(f"Unexpected error getting contact: {e}")
-        return error_msg
+    contact = await api.get_contact_details(validated_request.contact_id)
+    
+    # Format single contact as detailed view
+    name = contact.name or NO_NAME
+    midname = contact.midname or ""
+    lastname = contact.lastname or ""
+    full_name = f"{name} {midname} {lastname}".strip()
+    
+    parts = [f"Контакт #{contact.id}\n\n", f"Имя: {full_name}\n"]
+    
+    if contact.email:
+        parts.append(f"Email: {contact.email}\n")
+    if contact.phone:
+        parts.append(f"Телефон: {contact.phone}\n")
+    if contact.company:
+        parts.append(f"Компания: {contact.company}\n")
+    if contact.position:
+        parts.append(f"Должность: {contact.position}\n")
+    if contact.description:
+        parts.append(f"Описание: {contact.description}\n")  # Full description, not truncated
+    if contact.is_company:
+        parts.append("Тип: Компания\n")
+    if contact.created_date:
+        parts.append(f"Создан: {format_date(contact.created_date)}\n")
+    
+    parts.append(f"\nПолная детальная информация о контакте ID {contact.id}")
+    return "".join(parts)
 
 @mcp.tool()
+@tool_errors("получении комментария")
 async def get_comment(comment_id: int, fields: Optional[str] = None) -> str:
     """Get a comment by ID with optional fields selection."""
-    try:
-        request_data = {"id": comment_id, "fields": fields}
-        validated = validate_input(request_data, EntityByIdRequest)
-        if api is None:
-            return "API не инициализирован"
-        comment = await api.get_comment(validated.id, validated.fields)
-        return json.dumps(comment.model_dump(), indent=2, ensure_ascii=False)
-    except Exception as e:
-        return format_error(e, "получении комментария")
+    request_data = {"id": comment_id, "fields": fields}
+    validated = validate_input(request_data, EntityByIdRequest)
+    if api is None:
+        return "API не инициализирован"
+    comment = await api.get_comment(validated.id, validated.fields)
+    return dump_json(comment)
 
 @mcp.tool()
+@tool_errors("получении файла")
 async def get_file(file_id: int, fields: Optional[str] = None) -> str:
     """Get a file by ID with optional fields selection."""
-    try:
-        request_data = {"id": file_id, "fields": fields}
-        validated = validate_input(request_data, EntityByIdRequest)
-        if api is None:
-            return "API не инициализирован"
-        file = await api.get_file(validated.id, validated.fields)
-        return json.dumps(file.model_dump(), indent=2, ensure_ascii=False)
-    except Exception as e:
-        return format_error(e, "получении файла")
+    request_data = {"id": file_id, "fields": fields}
+    validated = validate_input(request_data, EntityByIdRequest)
+    if api is None:
+        return "API не инициализирован"
+    file = await api.get_file(validated.id, validated.fields)
+    return dump_json(file)
 
 @mcp.tool()
+@tool_errors("получении проекта")
 async def get_project(project_id: int, fields: Optional[str] = None) -> str:
     """Get a project by ID with optional fields selection."""
-    try:
-        request_data = {"id": project_id, "fields": fields}
-        validated = validate_input(request_data, EntityByIdRequest)
-        if api is None:
-            return "API не инициализирован"
-        project = await api.get_project(validated.id, validated.fields)
-        return json.dumps(project.model_dump(), indent=2, ensure_ascii=False)
-    except Exception as e:
-        return format_error(e, "получении проекта")
+    request_data = {"id": project_id, "fields": fields}
+    validated = validate_input(request_data, EntityByIdRequest)
+    if api is None:
+        return "API не инициализирован"
+    project = await api.get_project(validated.id, validated.fields)
+    return dump_json(project)
 
 @mcp.tool()
+@tool_errors("получении пользователя")
 async def get_user(user_id: int, fields: Optional[str] = None) -> str:
     """Get a user by ID with optional fields selection."""
-    try:
-        request_data = {"id": user_id, "fields": fields}
-        validated = validate_input(request_data, EntityByIdRequest)
-        if api is None:
-            return "API не инициализирован"
-        user = await api.get_user(validated.id, validated.fields)
-        return json.dumps(user.model_dump(), indent=2, ensure_ascii=False)
-    except Exception as e:
-        return format_error(e, "получении пользователя")
+    request_data = {"id": user_id, "fields": fields}
+    validated = validate_input(request_data, EntityByIdRequest)
+    if api is None:
+        return "API не инициализирован"
+    user = await api.get_user(validated.id, validated.fields)
+    return dump_json(user)
 
 @mcp.tool()
+@tool_errors("получении отчёта")
 async def get_report(report_id: int, fields: Optional[str] = None) -> str:
     """Get a report by ID with optional fields selection."""
-    try:
-        request_data = {"id": report_id, "fields": fields}
-        validated = validate_input(request_data, EntityByIdRequest)
-        if api is None:
-            return "API не инициализирован"
-        report = await api.get_report(validated.id, validated.fields)
-        return json.dumps(report.model_dump(), indent=2, ensure_ascii=False)
-    except Exception as e:
-        return format_error(e, "получении отчёта")
+    request_data = {"id": report_id, "fields": fields}
+    validated = validate_input(request_data, EntityByIdRequest)
+    if api is None:
+        return "API не инициализирован"
+    report = await api.get_report(validated.id, validated.fields)
+    return dump_json(report)
 
 @mcp.tool()
+@tool_errors("получении сотрудников")
 async def list_employees(
     offset: int = 0,
     limit: int = 20,
@@ -605,47 +608,27 @@ async def list_employees(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page
-        }
-        validated_request = validate_input(request_data, ListRequest)
-        
-        logger.info(f"Получение списка сотрудников: offset={validated_request.get_offset()}, limit={validated_request.limit}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        employees = await api.list_employees(limit=validated_request.limit, offset=validated_request.get_offset())
-        result = json.dumps([employee.model_dump() for employee in employees], indent=2, ensure_ascii=False)
-        
-        # Add pagination info
-        if len(employees) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(employees)} результатов (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(employees)} сотрудник(ов)"
-        
-        logger.info(f"Найдено сотрудников: {len(employees)}")
-        return result
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page
+    }
+    validated_request = validate_input(request_data, ListRequest)
+    
+    logger.info(f"Получение списка сотрудников: offset={validated_request.get_offset()}, limit={validated_request.limit}")
+    
+    if api is None:
+        return "API не инициализирован"
         
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения сотрудников: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении сотрудников")
-        logger.error(f"Unexpected error listing employees: {e}")
-        return error_msg
+    employees = await api.list_employees(limit=validated_request.limit, offset=validated_request.get_offset())
+    result = paginated_result(employees, validated_request, "сотрудник(ов)")
+    
+    logger.info(f"Найдено сотрудников: {len(employees)}")
+    return result
 
 @mcp.tool()
+@tool_errors("получении файлов")
 async def list_files(
     offset: int = 0,
     limit: int = 20,
@@ -706,61 +689,42 @@ async def list_files(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page,
-            "task_id": task_id,
-            "project_id": project_id
-        }
-        validated_request = validate_input(request_data, FileListRequest)
-        
-        logger.info(f"Получение списка файлов: offset={validated_request.get_offset()}, limit={validated_request.limit}, task_id={validated_request.task_id}, project_id={validated_request.project_id}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        files = await api.list_files(
-            limit=validated_request.limit,
-            offset=validated_request.get_offset(),
-            task_id=validated_request.task_id,
-            project_id=validated_request.project_id
-        )
-        result = json.dumps([file.model_dump() for file in files], indent=2, ensure_ascii=False)
-        
-        # Add pagination and filtering info
-        filter_info = []
-        if validated_request.task_id:
-            filter_info.append(f"задача {validated_request.task_id}")
-        if validated_request.project_id:
-            filter_info.append(f"проект {validated_request.project_id}")
-        filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
-        
-        if len(files) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(files)} результатов{filter_str} (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(files)} файл(ов){filter_str}"
-        
-        logger.info(f"Найдено файлов: {len(files)}")
-        return result
-        
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения файлов: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении файлов")
-        logger.error(f"Unexpected error listing files: {e}")
-        return error_msg
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page,
+        "task_id": task_id,
+        "project_id": project_id
+    }
+    validated_request = validate_input(request_data, FileListRequest)
+    
+    logger.info(f"Получение списка файлов: offset={validated_request.get_offset()}, limit={validated_request.limit}, task_id={validated_request.task_id}, project_id={validated_request.project_id}")
+    
+    if api is None:
+        return "API не инициализирован"
+        
+    files = await api.list_files(
+        limit=validated_request.limit,
+        offset=validated_request.get_offset(),
+        task_id=validated_request.task_id,
+        project_id=validated_request.project_id
+    )
+    # Add filtering info
+    filter_info = []
+    if validated_request.task_id:
+        filter_info.append(f"задача {validated_request.task_id}")
+    if validated_request.project_id:
+        filter_info.append(f"проект {validated_request.project_id}")
+    filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
+    
+    result = paginated_result(files, validated_request, "файл(ов)", filter_str)
+    
+    logger.info(f"Найдено файлов: {len(files)}")
+    return result
 
 @mcp.tool()
+@tool_errors("получении комментариев")
 async def list_comments(
     offset: int = 0,
     limit: int = 20,
@@ -825,61 +789,42 @@ async def list_comments(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page,
-            "task_id": task_id,
-            "project_id": project_id
-        }
-        validated_request = validate_input(request_data, CommentListRequest)
-        
-        logger.info(f"Получение списка комментариев: offset={validated_request.get_offset()}, limit={validated_request.limit}, task_id={validated_request.task_id}, project_id={validated_request.project_id}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        comments = await api.list_comments(
-            limit=validated_request.limit,
-            offset=validated_request.get_offset(),
-            task_id=validated_request.task_id,
-            project_id=validated_request.project_id
-        )
-        result = json.dumps([comment.model_dump() for comment in comments], indent=2, ensure_ascii=False)
-        
-        # Add pagination and filtering info
-        filter_info = []
-        if validated_request.task_id:
-            filter_info.append(f"задача {validated_request.task_id}")
-        if validated_request.project_id:
-            filter_info.append(f"проект {validated_request.project_id}")
-        filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
-        
-        if len(comments) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(comments)} результатов{filter_str} (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(comments)} комментар(иев){filter_str}"
-        
-        logger.info(f"Найдено комментариев: {len(comments)}")
-        return result
-        
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения комментариев: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении комментариев")
-        logger.error(f"Unexpected error listing comments: {e}")
-        return error_msg
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page,
+        "task_id": task_id,
+        "project_id": project_id
+    }
+    validated_request = validate_input(request_data, CommentListRequest)
+    
+    logger.info(f"Получение списка комментариев: offset={validated_request.get_offset()}, limit={validated_request.limit}, task_id={validated_request.task_id}, project_id={validated_request.project_id}")
+    
+    if api is None:
+        return "API не инициализирован"
+        
+    comments = await api.list_comments(
+        limit=validated_request.limit,
+        offset=validated_request.get_offset(),
+        task_id=validated_request.task_id,
+        project_id=validated_request.project_id
+    )
+    # Add filtering info
+    filter_info = []
+    if validated_request.task_id:
+        filter_info.append(f"задача {validated_request.task_id}")
+    if validated_request.project_id:
+        filter_info.append(f"проект {validated_request.project_id}")
+    filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
+    
+    result = paginated_result(comments, validated_request, "комментар(иев)", filter_str)
+    
+    logger.info(f"Найдено комментариев: {len(comments)}")
+    return result
 
 @mcp.tool()
+@tool_errors("получении отчётов")
 async def list_reports(
     offset: int = 0,
     limit: int = 20,
@@ -926,47 +871,27 @@ async def list_reports(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page
-        }
-        validated_request = validate_input(request_data, ListRequest)
-        
-        logger.info(f"Получение списка отчётов: offset={validated_request.get_offset()}, limit={validated_request.limit}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        reports = await api.list_reports(limit=validated_request.limit, offset=validated_request.get_offset())
-        result = json.dumps([report.model_dump() for report in reports], indent=2, ensure_ascii=False)
-        
-        # Add pagination info
-        if len(reports) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(reports)} результатов (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(reports)} отчёт(ов)"
-        
-        logger.info(f"Найдено отчётов: {len(reports)}")
-        return result
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page
+    }
+    validated_request = validate_input(request_data, ListRequest)
+    
+    logger.info(f"Получение списка отчётов: offset={validated_request.get_offset()}, limit={validated_request.limit}")
+    
+    if api is None:
+        return "API не инициализирован"
         
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения отчётов: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении отчётов")
-        logger.error(f"Unexpected error listing reports: {e}")
-        return error_msg
+    reports = await api.list_reports(limit=validated_request.limit, offset=validated_request.get_offset())
+    result = paginated_result(reports, validated_request, "отчёт(ов)")
+    
+    logger.info(f"Найдено отчётов: {len(reports)}")
+    return result
 
 @mcp.tool()
+@tool_errors("получении процессов")
 async def list_processes(
     offset: int = 0,
     limit: int = 20,
@@ -1014,53 +939,45 @@ async def list_processes(
         PlanfixValidationError: Invalid input parameters
         PlanfixError: API communication or server error
     """
-    try:
-        # Validate input parameters
-        request_data = {
-            "offset": offset,
-            "limit": limit,
-            "page": page
-        }
-        validated_request = validate_input(request_data, ListRequest)
-        
-        logger.info(f"Получение списка процессов: offset={validated_request.get_offset()}, limit={validated_request.limit}")
-        
-        if api is None:
-            return "API не инициализирован"
-            
-        processes = await api.list_processes(limit=validated_request.limit, offset=validated_request.get_offset())
-        result = json.dumps([process.model_dump() for process in processes], indent=2, ensure_ascii=False)
-        
-        # Add pagination info
-        if len(processes) >= validated_request.limit:
-            result += f"\n\nПоказаны {len(processes)} результатов (лимит: {validated_request.limit})"
-            if validated_request.page:
-                result += f", страница {validated_request.page}"
-            else:
-                result += f", смещение {validated_request.get_offset()}"
-            result += ". Используйте параметры offset/page для получения следующих результатов."
-        else:
-            result += f"\n\nВсего найдено: {len(processes)} процесс(ов)"
-        
-        logger.info(f"Найдено процессов: {len(processes)}")
-        return result
+    # Validate input parameters
+    request_data = {
+        "offset": offset,
+        "limit": limit,
+        "page": page
+    }
+    validated_request = validate_input(request_data, ListRequest)
+    
+    logger.info(f"Получение списка процессов: offset={validated_request.get_offset()}, limit={validated_request.limit}")
+    
+    if api is None:
+        return "API не инициализирован"
         
-    except PlanfixValidationError as e:
-        error_msg = f"{str(e)}"
-        logger.error(f"Ошибка валидации получения процессов: {e}")
-        return error_msg
-    except Exception as e:
-        error_msg = format_error(e, "получении процессов")
-        logger.error(f"Unexpected error listing processes: {e}")
-        return error_msg
+    processes = await api.list_processes(limit=validated_request.limit, offset=validated_request.get_offset())
+    result = paginated_result(processes, validated_request, "процесс(ов)")
+    
+    logger.info(f"Найдено процессов: {len(processes)}")
+    return result
 
 # ============================================================================
 # РЕСУРСЫ (RESOURCES) - Данные для чтения LLM
 # ============================================================================
 
+# The dashboard is polled repeatedly by the LLM; reuse a fresh summary
+# instead of hitting the Planfix API again
+DASHBOARD_CACHE_TTL = 5.0
+_dashboard_cache: Dict[str, Any] = {"ts": 0.0, "value": ""}
+
+def reset_dashboard_cache() -> None:
+    """Drop the cached dashboard summary so the next read refetches it."""
+    _dashboard_cache.update(ts=0.0, value="")
+
 @mcp.resource("dashboard://summary")
 async def get_dashboard_summary() -> str:
     """Сводка по рабочему пространству Planfix."""
+    now = time.monotonic()
+    if _dashboard_cache["value"] and now - _dashboard_cache["ts"] < DASHBOARD_CACHE_TTL:
+        return _dashboard_cache["value"]
+    
     try:
         # Get current data
         active_tasks = await api.list_tasks(status="active")
@@ -1068,34 +985,91 @@ async def get_dashboard_summary() -> str:
         
         # Calculate stats
         active_count = len(active_tasks)
-        overdue_count = sum(1 for task in active_tasks 
-                          if hasattr(task, 'deadline') and task.deadline and task.deadline < datetime.now().strftime("%Y-%m-%d"))
+        today = datetime.now().strftime("%Y-%m-%d")
+        overdue_count = 0
+        for task in active_tasks:
+            deadline = getattr(task, 'deadline', None)
+            if deadline and deadline < today:
+                overdue_count += 1
         
         # Get completed tasks today (mock data for now)
         completed_today = 8  # This would be a real API call
         
-        result = f"Сводка Planfix на {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-        
-        result += "ЗАДАЧИ:\n"
-        result += f"- Активные: {active_count}\n"
-        result += f"- Просрочены: {overdue_count}\n"
-        result += f"- Завершены сегодня: {completed_today}\n\n"
-        
-        result += "ПРОЕКТЫ:\n"
-        result += f"- Всего проектов: {len(projects)}\n"
         active_projects = [p for p in projects if hasattr(p, 'status') and p.status != "COMPLETED"]
-        result += f"- Активные: {len(active_projects)}\n\n"
-        
-        result += "АКТИВНОСТЬ:\n"
-        result += f"- Средняя загрузка: 78%\n"  # Mock data
-        result += f"- Обновлено: {datetime.now().strftime('%H:%M')}\n"
         
+        result = "".join([
+            f"Сводка Planfix на {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n",
+            "ЗАДАЧИ:\n",
+            f"- Активные: {active_count}\n",
+            f"- Просрочены: {overdue_count}\n",
+            f"- Завершены сегодня: {completed_today}\n\n",
+            "ПРОЕКТЫ:\n",
+            f"- Всего проектов: {len(projects)}\n",
+            f"- Активные: {len(active_projects)}\n\n",
+            "АКТИВНОСТЬ:\n",
+            "- Средняя загрузка: 78%\n",  # Mock data
+            f"- Обновлено: {datetime.now().strftime('%H:%M')}\n",
+        ])
+        
+        _dashboard_cache.update(ts=now, value=result)
         return result
         
     except Exception as e:
         logger.error(f"Error getting dashboard: {e}")
         return f"Ошибка получения сводки: {format_error(e)}"
 
+
+def _project_row(project: Any) -> str:
+    """Title and detail lines of a project for the projects list.
+
+    Takes any project-like record: the optional fields are probed with getattr.
+    """
+    row = f"{project.name} (#{project.id})\n"
+    status = getattr(project, 'status', None)
+    if status:
+        row += f"- Статус: {status}\n"
+    owner = getattr(project, 'owner', None)
+    if owner:
+        row += f"- Владелец: {owner}\n"
+    task_count = getattr(project, 'task_count', None)
+    if task_count:
+        row += f"- Задач: {task_count}\n"
+    return row
+
+
+def _contact_row(contact: Any) -> str:
+    """Title and detail lines of a contact for the recent contacts list.
+
+    Takes any contact-like record: the optional fields are probed with getattr.
+    """
+    contact_id = getattr(contact, 'id', None) or 0
+    contact_name = getattr(contact, 'name', None) or NO_NAME
+    row = f"{contact_name} (#{contact_id})\n"
+
+    email = getattr(contact, 'email', None)
+    if email:
+        row += f"- Email: {email}\n"
+
+    phone = None
+    phones = getattr(contact, 'phones', None)
+    if phones and len(phones) > 0 and getattr(phones[0], 'number', None):
+        phone = phones[0].number
+    if phone:
+        row += f"- Телефон: {phone}\n"
+
+    companies = getattr(contact, 'companies', None)
+    if companies:
+        company_names = [c.name for c in companies if getattr(c, 'name', None)]
+        if company_names:
+            row += f"- Компания: {', '.join(company_names)}\n"
+
+    position = getattr(contact, 'position', None)
+    if position:
+        row += f"- Должность: {position}\n"
+
+    return row
+
+
 @mcp.resource("projects://list")
 async def get_projects_list() -> str:
     """Список всех проектов."""
@@ -1105,19 +1079,7 @@ async def get_projects_list() -> str:
         if not projects:
             return "Проекты не найдены."
         
-        result = f"Проекты ({len(projects)} шт.)\n\n"
-        
-        for i, project in enumerate(projects, 1):
-            result += f"{i}. {project.name} (#{project.id})\n"
-            if hasattr(project, 'status') and project.status:
-                result += f"- Статус: {project.status}\n"
-            if hasattr(project, 'owner') and project.owner:
-                result += f"- Владелец: {project.owner}\n"
-            if hasattr(project, 'task_count') and project.task_count:
-                result += f"- Задач: {project.task_count}\n"
-            result += "\n"
-        
-        return result.strip()
+        return numbered_list("Проекты", projects, _project_row)
         
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
@@ -1137,39 +1099,45 @@ async def get_task_details(task_id: str) -> str:
         
         task = await api.get_task(task_id_int)
         
-        result = f"Задача #{task.id}\n\n"
-        result += f"Название: {task.name}\n"
+        parts = [f"Задача #{task.id}\n\n", f"Название: {task.name}\n"]
         
-        if hasattr(task, 'description') and task.description:
-            result += f"Описание: {task.description[:200]}{'...' if len(task.description) > 200 else ''}\n"
+        description = getattr(task, 'description', None)
+        if description:
+            parts.append(f"Описание: {truncate_text(description, 200)}\n")
         
-        if hasattr(task, 'status') and task.status:
-            result += f"Статус: {task.status}\n"
+        status = getattr(task, 'status', None)
+        if status:
+            parts.append(f"Статус: {status}\n")
         
         # Handle both TaskResponse and legacy Task models for assignee
         assignee = None
-        if hasattr(task, 'assigner') and task.assigner:
-            assignee = getattr(task.assigner, 'name', None)
-        elif hasattr(task, 'assignees') and task.assignees and task.assignees.users:
-            assignee = task.assignees.users[0].name if task.assignees.users[0].name else "Assigned"
-        elif hasattr(task, 'assignee') and task.assignee:
-            assignee = task.assignee
+        assigner = getattr(task, 'assigner', None)
+        assignees = getattr(task, 'assignees', None)
+        if assigner:
+            assignee = getattr(assigner, 'name', None)
+        elif assignees and assignees.users:
+            assignee = assignees.users[0].name if assignees.users[0].name else "Assigned"
+        else:
+            assignee = getattr(task, 'assignee', None)
         
         if assignee:
-            result += f"Исполнитель: {assignee}\n"
+            parts.append(f"Исполнитель: {assignee}\n")
         
-        if hasattr(task, 'project') and task.project:
-            result += f"Проект: {task.project}\n"
+        project = getattr(task, 'project', None)
+        if project:
+            parts.append(f"Проект: {project}\n")
         
-        if hasattr(task, 'priority') and task.priority:
-            result += f"Приоритет: {task.priority}\n"
+        priority = getattr(task, 'priority', None)
+        if priority:
+            parts.append(f"Приоритет: {priority}\n")
         
-        if hasattr(task, 'deadline') and task.deadline:
-            result += f"Срок: {format_date(task.deadline)}\n"
+        deadline = getattr(task, 'deadline', None)
+        if deadline:
+            parts.append(f"Срок: {format_date(deadline)}\n")
         
-        result += f"\nОбновлено: {datetime.now().strftime('%d.%m.%Y %H:%M')}"
+        parts.append(f"\nОбновлено: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error getting task {task_id}: {e}")
@@ -1184,37 +1152,7 @@ async def get_recent_contacts() -> str:
         if not contacts:
             return "Контакты не найдены."
         
-        result = f"Недавние контакты ({len(contacts)} шт.)\n\n"
-
-        for i, contact in enumerate(contacts, 1):
-            contact_id = getattr(contact, 'id', None) or 0
-            contact_name = getattr(contact, 'name', None) or "Без имени"
-            result += f"{i}. {contact_name} (#{contact_id})\n"
-
-            email = getattr(contact, 'email', None)
-            if email:
-                result += f"- Email: {email}\n"
-
-            phone = None
-            phones = getattr(contact, 'phones', None)
-            if phones and len(phones) > 0 and getattr(phones[0], 'number', None):
-                phone = phones[0].number
-            if phone:
-                result += f"- Телефон: {phone}\n"
-
-            companies = getattr(contact, 'companies', None)
-            if companies:
-                company_names = [c.name for c in companies if getattr(c, 'name', None)]
-                if company_names:
-                    result += f"- Компания: {', '.join(company_names)}\n"
-
-            position = getattr(contact, 'position', None)
-            if position:
-                result += f"- Должность: {position}\n"
-
-            result += "\n"
-        
-        return result.strip()
+        return numbered_list("Недавние контакты", contacts, _contact_row)
         
     except Exception as e:
         logger.error(f"Error getting contacts: {e}")
@@ -1224,10 +1162,7 @@ async def get_recent_contacts() -> str:
 # ПРОМПТЫ (PROMPTS) - Шаблоны для LLM
 # ============================================================================
 
-@mcp.prompt()
-def analyze_project_status(project_name: str) -> str:
-    """Шаблон для анализа состояния проекта."""
-    return f"""Проанализируй текущее состояние проекта "{project_name}" в Planfix:
+_ANALYZE_PROJECT_PROMPT = """Проанализируй текущее состояние проекта "{project_name}" в Planfix:
 
 🔍 **АНАЛИЗ ПРОЕКТА:**
 1. Проверь выполнение задач по срокам
@@ -1256,12 +1191,7 @@ def analyze_project_status(project_name: str) -> str:
 • Рекомендациями по оптимизации
 • Прогнозом завершения проекта"""
 
-@mcp.prompt()
-def create_weekly_report(week_start: str) -> str:
-    """Шаблон для создания еженедельного отчёта."""
-    week_end = (datetime.strptime(week_start, "%Y-%m-%d") + timedelta(days=6)).strftime("%Y-%m-%d")
-    
-    return f"""Создай еженедельный отчёт по работе команды за период {week_start} - {week_end}:
+_WEEKLY_REPORT_PROMPT = """Создай еженедельный отчёт по работе команды за период {week_start} - {week_end}:
 
 ПОКАЗАТЕЛИ НЕДЕЛИ::
 • Количество завершённых задач
@@ -1296,10 +1226,7 @@ def create_weekly_report(week_start: str) -> str:
 • Планируемые результаты
 • Профилактические меры"""
 
-@mcp.prompt()
-def plan_sprint(sprint_duration: int = 14) -> str:
-    """Шаблон для планирования спринта."""
-    return f"""Спланируй спринт продолжительностью {sprint_duration} дней:
+_PLAN_SPRINT_PROMPT = """Спланируй спринт продолжительностью {sprint_duration} дней:
 
 ЦЕЛИ СПРИНТА::
 1. Определи основные цели и результаты спринта
@@ -1338,6 +1265,23 @@ def plan_sprint(sprint_duration: int = 14) -> str:
 - План коммуникации и отчётности
 - Критерии оценки успеха спринта"""
 
+@mcp.prompt()
+def analyze_project_status(project_name: str) -> str:
+    """Шаблон для анализа состояния проекта."""
+    return _ANALYZE_PROJECT_PROMPT.format(project_name=project_name)
+
+@mcp.prompt()
+def create_weekly_report(week_start: str) -> str:
+    """Шаблон для создания еженедельного отчёта."""
+    week_end = (datetime.strptime(week_start, "%Y-%m-%d") + timedelta(days=6)).strftime("%Y-%m-%d")
+    
+    return _WEEKLY_REPORT_PROMPT.format(week_start=week_start, week_end=week_end)
+
+@mcp.prompt()
+def plan_sprint(sprint_duration: int = 14) -> str:
+    """Шаблон для планирования спринта."""
+    return _PLAN_SPRINT_PROMPT.format(sprint_duration=sprint_duration)
+
 # ============================================================================
 # ЗАПУСК СЕРВЕРА
 # ============================================================================
@@ -1395,9 +1339,13 @@ def main():
         config.debug = True
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # uvloop schedules coroutines and I/O faster than the stock asyncio loop;
+    # fall back to the stock loop where it is not installed (Windows, PyPy)
+    use_uvloop = importlib.util.find_spec("uvloop") is not None
+    
     try:
         logger.info("Запуск Planfix MCP Server...")
-        mcp.run(transport="stdio")
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": use_uvloop})
     except KeyboardInterrupt:
         logger.info("Сервер остановлен пользователем")
     except Exception as e:
@@ -1,43 +1,75 @@
-"""Utility functions and helpers for the Planfix MCP server."""
+"""Utility functions and helpers for the Planfix MCP server.
 
-from datetime import datetime
+Everything here is string formatting. If these helpers ever need to be
+faster, compile the module with mypyc rather than reaching for numba,
+which does not accelerate str-heavy code.
+"""
+
+import functools
+import logging
+from datetime import date, datetime
 from typing import Any, Dict, Optional
 
-from .config import config
+from pydantic import TypeAdapter
 
-# Configure logging
-import logging
 logger = logging.getLogger(__name__)
 
+DATETIME_DISPLAY_FORMAT = "%Y-%m-%d %H:%M"
+DATE_DISPLAY_FORMAT = "%Y-%m-%d"
+NOT_AVAILABLE = "N/A"
+
+# Serializes models (and lists of models) straight to JSON in pydantic-core
+_JSON_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
 
-def format_date(date_input: Optional[Any]) -> str:
+# Marks a key absent from a mapping, since None may be a stored value
+_MISSING = object()
+
+
+def format_date(date_input: Any) -> str:
     """Format date string or TimePoint object for display."""
     if not date_input:
-        return "N/A"
+        return NOT_AVAILABLE
     
     # Handle string input
     if isinstance(date_input, str):
-        try:
-            # Try to parse ISO format
-            if 'T' in date_input:
-                dt = datetime.fromisoformat(date_input.replace('Z', '+00:00'))
-                return dt.strftime("%Y-%m-%d %H:%M")
-            
-            # Try to parse date only
-            dt = datetime.strptime(date_input, "%Y-%m-%d")
-            return dt.strftime("%Y-%m-%d")
-        except (ValueError, TypeError):
-            return date_input
+        return _format_date_str(date_input)
     
     # Handle TimePoint object from new models
-    if hasattr(date_input, 'datetime') and date_input.datetime:
-        return format_date(date_input.datetime)
-    elif hasattr(date_input, 'date') and date_input.date:
-        return format_date(date_input.date)
+    value = getattr(date_input, 'datetime', None) or getattr(date_input, 'date', None)
+    if value:
+        return format_date(value)
     
     return str(date_input)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_date_str(date_str: str) -> str:
+    """Format a date string; cached because list responses repeat the same timestamps."""
+    try:
+        # ISO datetime; fromisoformat() only accepts a trailing 'Z' on 3.11+
+        if 'T' in date_str:
+            if date_str[-1] == 'Z':
+                return datetime.fromisoformat(date_str[:-1] + '+00:00').strftime(DATETIME_DISPLAY_FORMAT)
+            return datetime.fromisoformat(date_str).strftime(DATETIME_DISPLAY_FORMAT)
+        
+        # Date only
+        return date.fromisoformat(date_str).strftime(DATE_DISPLAY_FORMAT)
+    except ValueError:
+        return date_str
+
+
+def dump_json(data: Any) -> str:
+    """Serialize a model or a list of models to indented JSON for display."""
+    return _JSON_ADAPTER.dump_json(data, indent=2).decode()
+
+
+def truncate_text(text: str, max_length: int = 100) -> str:
+    """Truncate text to max_length characters, marking the cut with '...'."""
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length - 3]}..."
+
+
 def format_error(error: Exception, context: str = "") -> str:
     """Format error message for display."""
     error_type = type(error).__name__
@@ -51,19 +83,23 @@ def format_error(error: Exception, context: str = "") -> str:
 
 def log_api_call(method: str, endpoint: str, response_code: Optional[int] = None) -> None:
     """Log API call for debugging."""
-    if config.debug:
-        if response_code:
-            logger.debug(f"API call: {method} {endpoint} -> {response_code}")
-        else:
-            logger.debug(f"API call: {method} {endpoint}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if response_code:
+        logger.debug("API call: %s %s -> %s", method, endpoint, response_code)
+    else:
+        logger.debug("API call: %s %s", method, endpoint)
 
 
 def safe_get(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
     """Safely get nested values from a dictionary."""
     current: Any = data
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        if not isinstance(current, dict):
+            return default
+        # get() rather than [] so that dict subclasses such as defaultdict
+        # and Counter do not run __missing__ to insert or invent a value
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
     return current
\ No newline at end of file
@@ -1,39 +1,41 @@
 """Test configuration and fixtures."""
 
+import copy
 import os
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, Mock
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
+from unittest.mock import AsyncMock
 
-# Set test environment variables
-os.environ["PLANFIX_ACCOUNT"] = "test-account"
-os.environ["PLANFIX_API_KEY"] = "test-api-key"
-os.environ["PLANFIX_USER_KEY"] = "test-user-key"
-os.environ["DEBUG"] = "true"
+from tests.fakes import FakeContact, FakeProject, FakeTask
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Base test environment, set once at import so it is in place before test
+# modules import src; tests patch only the variables they change
+BASE_ENV = {
+    "PLANFIX_ACCOUNT": "test-account",
+    "PLANFIX_API_KEY": "test-api-key",
+    "PLANFIX_USER_KEY": "test-user-key",
+    "DEBUG": "true",
+}
+os.environ.update(BASE_ENV)
 
-@pytest.fixture
-def mock_api():
-    """Mock Planfix API client."""
-    api = AsyncMock()
-    
-    # Mock task operations
-    api.create_task.return_value = Mock(
-        id=123,
-        name="Test Task",
-        description="Test Description",
-        priority="HIGH",
-        deadline="2024-12-31"
-    )
+def _returns(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Coroutine function stub that always returns ``value``."""
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+    return stub
+
+# API methods that tests assert on or override; the rest are plain stubs
+RECORDING_METHODS = ("list_tasks", "list_contacts")
+
+@pytest.fixture(scope="session")
+def _mock_api_template():
+    """Mock Planfix API client, built once per test session."""
+    api = SimpleNamespace()
     
-    api.search_tasks.return_value = [
-        Mock(
+    # Tasks
+    api.list_tasks = AsyncMock(return_value=[
+        FakeTask(
             id=123,
             name="Test Task 1",
             status="В работе",
@@ -41,7 +43,7 @@ def mock_api():
             project="Тестовый проект",
             deadline="2024-12-31"
         ),
-        Mock(
+        FakeTask(
             id=124,
             name="Test Task 2",
             status="Новая",
@@ -49,9 +51,9 @@ def mock_api():
             project="Другой проект",
             deadline=None
         )
-    ]
+    ])
     
-    api.get_task.return_value = Mock(
+    api.get_task = _returns(FakeTask(
         id=123,
         name="Test Task",
         description="Detailed test description",
@@ -60,20 +62,11 @@ def mock_api():
         project="Тестовый проект",
         priority="HIGH",
         deadline="2024-12-31"
-    )
-    
-    api.update_task_status.return_value = True
-    api.add_task_comment.return_value = True
+    ))
     
-    # Mock project operations
-    api.create_project.return_value = Mock(
-        id=456,
-        name="Test Project",
-        description="Test Project Description"
-    )
-    
-    api.get_projects.return_value = [
-        Mock(
+    # Projects
+    api.list_projects = _returns([
+        FakeProject(
             id=456,
             name="Test Project 1",
             description="Description 1",
@@ -81,91 +74,55 @@ def mock_api():
             owner="Руководитель",
             task_count=5
         ),
-        Mock(
+        FakeProject(
             id=457,
             name="Test Project 2",
             description="Description 2",
-            status="Завершён",
+            status="COMPLETED",
             owner="Менеджер",
             task_count=0
         )
-    ]
+    ])
     
-    # Mock contact operations
-    api.add_contact.return_value = Mock(
+    # Contacts
+    api.get_contact_details = _returns(FakeContact(
         id=789,
         name="Test Contact",
         email="test@example.com",
         phone="+7-999-123-45-67",
         company="Test Company",
         position="Manager"
-    )
+    ))
     
-    api.get_contacts.return_value = [
-        Mock(
+    api.list_contacts = AsyncMock(return_value=[
+        FakeContact(
             id=789,
             name="Test Contact 1",
             email="contact1@example.com",
-            phone="+7-999-111-11-11",
-            company="Company 1",
             position="Manager"
         ),
-        Mock(
+        FakeContact(
             id=790,
             name="Test Contact 2",
             email="contact2@example.com",
-            phone="+7-999-222-22-22",
-            company="Company 2",
             position="Developer"
         )
-    ]
-    
-    # Mock analytics
-    api.get_analytics_report.return_value = {
-        "report_type": "time",
-        "period": "2024-01-01 - 2024-01-31",
-        "group_by": "user",
-        "data": [
-            {"name": "Иван Петров", "value": "40 часов"},
-            {"name": "Мария Иванова", "value": "35 часов"}
-        ],
-        "summary": {
-            "total_time": "75 часов",
-            "average_per_user": "37.5 часов"
-        }
-    }
+    ])
     
-    api.test_connection.return_value = True
+    api.test_connection = _returns(True)
     
     return api
 
 @pytest.fixture
-def sample_task_data():
-    """Sample task data for tests."""
-    return {
-        "name": "Test Task",
-        "description": "Test task description",
-        "priority": "HIGH",
-        "deadline": "2024-12-31"
-    }
+def mock_api(_mock_api_template):
+    """Mock Planfix API client.
 
-@pytest.fixture
-def sample_project_data():
-    """Sample project data for tests."""
-    return {
-        "name": "Test Project",
-        "description": "Test project description",
-        "owner_id": 1,
-        "client_id": 2
-    }
-
-@pytest.fixture
-def sample_contact_data():
-    """Sample contact data for tests."""
-    return {
-        "name": "Test Contact",
-        "email": "test@example.com",
-        "phone": "+7-999-123-45-67",
-        "company": "Test Company",
-        "position": "Manager"
-    }
\ No newline at end of file
+    A shallow copy of the session template, so a test may swap out whole
+    methods without affecting other tests. The recording methods get fresh
+    AsyncMocks, so call history and side_effect overrides end with the test.
+    """
+    api = copy.copy(_mock_api_template)
+    for name in RECORDING_METHODS:
+        shared = getattr(_mock_api_template, name)
+        setattr(api, name, AsyncMock(return_value=shared.return_value))
+    return api
@@ -0,0 +1,54 @@
+"""Fake API records and assertion helpers shared by the tests."""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Optional
+
+@dataclass(frozen=True, slots=True)
+class FakeTask:
+    """Task record returned by the mocked API."""
+    id: int
+    name: str
+    description: str = ""
+    status: str = ""
+    assignee: str = ""
+    project: str = ""
+    priority: str = ""
+    deadline: Optional[str] = None
+
+@dataclass(frozen=True, slots=True)
+class FakeProject:
+    """Project record returned by the mocked API."""
+    id: int
+    name: str
+    description: str = ""
+    status: str = ""
+    owner: str = ""
+    task_count: int = 0
+
+@dataclass(frozen=True, slots=True)
+class FakeContact:
+    """Contact record returned by the mocked API."""
+    id: int
+    name: str
+    midname: str = ""
+    lastname: str = ""
+    email: str = ""
+    phone: str = ""
+    company: str = ""
+    position: str = ""
+    description: str = ""
+    is_company: bool = False
+    created_date: Optional[str] = None
+
+def assert_contains_all(text: str, fragments: Iterable[str]) -> None:
+    """Assert that every fragment occurs in text, listing the missing ones."""
+    missing = [fragment for fragment in fragments if fragment not in text]
+    assert not missing, f"missing {missing!r} in:\n{text}"
+
+# Sample tool arguments
+SAMPLE_TASK_FILTERS = MappingProxyType({
+    "project_id": 10,
+    "assignee_id": 20,
+    "status": "active",
+})
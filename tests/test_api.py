@@ -1,323 +1,233 @@
 """Tests for Planfix API client."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 import httpx
 
-from src.planfix_api import PlanfixAPI, PlanfixError, PlanfixAuthError, PlanfixNotFoundError
+from src.planfix_api import (
+    PlanfixAPI, PlanfixError, PlanfixAuthError, PlanfixNotFoundError, PlanfixValidationError
+)
+
+from tests.fakes import assert_contains_all
+
+# Fields that get_task and list_tasks request by default
+TASK_FIELDS = "id,name,description,priority,status,assigner,assignees,project,startDateTime,endDateTime"
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Create API client instance shared by the tests in this module."""
+    return PlanfixAPI()
+
+
+@pytest.fixture(scope="module")
+def patched_httpx():
+    """Patch httpx.AsyncClient once for the module."""
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_client.return_value.__aenter__.return_value = AsyncMock()
+        yield mock_client
+
+
+@pytest.fixture
+def http_client(patched_httpx):
+    """Client instance returned by ``async with httpx.AsyncClient(...)``."""
+    client = patched_httpx.return_value.__aenter__.return_value
+    yield client
+    client.request.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_request(api_client):
+    """Replace the shared client's _request with an AsyncMock for one test."""
+    api_client._request = AsyncMock()
+    yield api_client._request
+    del api_client._request
 
 
 class TestPlanfixAPI:
     """Test Planfix API client."""
     
-    @pytest.fixture
-    def api_client(self):
-        """Create API client instance."""
-        return PlanfixAPI()
-    
-    @pytest.mark.asyncio
-    async def test_create_task_success(self, api_client, mock_api):
-        """Test successful task creation."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"id": 123}
-            
-            task = await api_client.create_task(
-                name="Test Task",
-                description="Test Description",
-                priority="HIGH"
-            )
-            
-            assert task.id == 123
-            assert task.name == "Test Task"
-            assert task.priority == "HIGH"
-            
-            mock_request.assert_called_once_with(
-                "POST", 
-                "task",
-                {
-                    "name": "Test Task",
-                    "description": "Test Description", 
-                    "priority": "HIGH"
-                }
-            )
-    
-    @pytest.mark.asyncio
-    async def test_create_task_with_all_params(self, api_client):
-        """Test task creation with all parameters."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"id": 124}
-            
-            task = await api_client.create_task(
-                name="Complex Task",
-                description="Complex Description",
-                project_id=10,
-                assignee_id=20,
-                priority="CRITICAL",
-                deadline="2024-12-31"
-            )
-            
-            expected_data = {
-                "name": "Complex Task",
-                "description": "Complex Description",
-                "priority": "CRITICAL",
-                "project": {"id": 10},
-                "assignee": {"id": 20},
-                "endDatePlan": "2024-12-31"
-            }
-            
-            mock_request.assert_called_once_with("POST", "task", expected_data)
-    
-    @pytest.mark.asyncio
-    async def test_search_tasks_basic(self, api_client):
-        """Test basic task search."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {
-                "tasks": [
-                    {
-                        "id": 123,
-                        "name": "Task 1",
-                        "status": {"name": "В работе"},
-                        "assignee": {"name": "Иван"},
-                        "project": {"name": "Проект 1"}
-                    }
-                ]
-            }
-            
-            tasks = await api_client.search_tasks(query="test")
-            
-            assert len(tasks) == 1
-            assert tasks[0].id == 123
-            assert tasks[0].name == "Task 1"
-            assert tasks[0].status == "В работе"
-    
-    @pytest.mark.asyncio
-    async def test_search_tasks_with_filters(self, api_client):
-        """Test task search with filters."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"tasks": []}
-            
-            await api_client.search_tasks(
-                query="test",
-                project_id=10,
-                assignee_id=20,
-                status="completed"
-            )
-            
-            expected_params = {
-                "fields": "id,name,status,assignee,project,endDatePlan,priority",
-                "name": "test",
-                "project": 10,
-                "assignee": 20,
-                "status": "completed"
-            }
-            
-            mock_request.assert_called_once_with("GET", "task/list", params=expected_params)
-    
-    @pytest.mark.asyncio
-    async def test_get_task(self, api_client):
-        """Test getting single task."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {
+    async def test_get_task(self, api_client, mock_request):
+        """Test getting a task by ID with the default fields."""
+        mock_request.return_value = {
+            "task": {
                 "id": 123,
                 "name": "Test Task",
-                "description": "Description",
-                "status": {"name": "В работе"},
-                "assignee": {"name": "Иван"},
-                "project": {"name": "Проект"},
-                "priority": "HIGH",
-                "endDatePlan": "2024-12-31"
-            }
-            
-            task = await api_client.get_task(123)
-            
-            assert task.id == 123
-            assert task.name == "Test Task"
-            assert task.status == "В работе"
-            assert task.priority == "HIGH"
-            
-            mock_request.assert_called_once_with("GET", "task/123")
-    
-    @pytest.mark.asyncio
-    async def test_update_task_status(self, api_client):
-        """Test updating task status."""
-        with patch.object(api_client, '_request') as mock_request:
-            result = await api_client.update_task_status(123, "COMPLETED", "Done!")
-            
-            assert result is True
-            
-            expected_data = {
-                "status": {"key": "COMPLETED"},
-                "comment": "Done!"
+                "priority": "High",
+                "status": {"id": 2, "name": "В работе"}
             }
-            
-            mock_request.assert_called_once_with("POST", "task/123", expected_data)
-    
-    @pytest.mark.asyncio
-    async def test_add_task_comment(self, api_client):
-        """Test adding task comment."""
-        with patch.object(api_client, '_request') as mock_request:
-            result = await api_client.add_task_comment(123, "Test comment")
-            
-            assert result is True
-            
-            expected_data = {"comment": "Test comment"}
-            mock_request.assert_called_once_with("POST", "task/123/comment", expected_data)
-    
-    @pytest.mark.asyncio
-    async def test_create_project(self, api_client):
-        """Test project creation."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"id": 456}
-            
-            project = await api_client.create_project(
-                name="Test Project",
-                description="Description",
-                owner_id=10,
-                client_id=20
-            )
-            
-            assert project.id == 456
-            assert project.name == "Test Project"
-            
-            expected_data = {
-                "name": "Test Project",
-                "description": "Description",
-                "owner": {"id": 10},
-                "client": {"id": 20}
-            }
-            
-            mock_request.assert_called_once_with("POST", "project", expected_data)
-    
-    @pytest.mark.asyncio
-    async def test_get_projects(self, api_client):
-        """Test getting projects list."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {
-                "projects": [
-                    {
-                        "id": 456,
-                        "name": "Project 1",
-                        "status": {"name": "Активный"},
-                        "owner": {"name": "Владелец"},
-                        "taskCount": 5
-                    }
+        }
+        
+        task = await api_client.get_task(123)
+        
+        assert task.id == 123
+        assert task.name == "Test Task"
+        assert task.status.name == "В работе"
+        
+        mock_request.assert_called_once_with(
+            "GET",
+            "task/123",
+            params={"fields": TASK_FIELDS}
+        )
+    
+    async def test_get_task_custom_fields(self, api_client, mock_request):
+        """Test requesting selected task fields."""
+        mock_request.return_value = {"task": {"id": 123}}
+        
+        await api_client.get_task(123, fields="id,name")
+        
+        mock_request.assert_called_once_with("GET", "task/123", params={"fields": "id,name"})
+    
+    async def test_get_task_missing_key(self, api_client, mock_request):
+        """Test a response without the task key is rejected."""
+        mock_request.return_value = {"id": 123}
+        
+        with pytest.raises(PlanfixValidationError, match="Expected key 'task'"):
+            await api_client.get_task(123)
+    
+    async def test_list_tasks_basic(self, api_client, mock_request):
+        """Test listing tasks without filters."""
+        mock_request.return_value = {
+            "tasks": [
+                {"id": 123, "name": "Task 1"},
+                {"id": 124, "name": "Task 2"}
+            ]
+        }
+        
+        tasks = await api_client.list_tasks()
+        
+        assert [task.id for task in tasks] == [123, 124]
+        
+        mock_request.assert_called_once_with(
+            "POST",
+            "task/list",
+            data={"offset": 0, "pageSize": 20, "fields": TASK_FIELDS}
+        )
+    
+    async def test_list_tasks_with_filters(self, api_client, mock_request):
+        """Test listing tasks by project and assignee with pagination."""
+        mock_request.return_value = {"tasks": []}
+        
+        tasks = await api_client.list_tasks(project_id=10, assignee_id=20, limit=5, offset=10)
+        
+        assert tasks == []
+        
+        mock_request.assert_called_once_with(
+            "POST",
+            "task/list",
+            data={
+                "offset": 10,
+                "pageSize": 5,
+                "fields": TASK_FIELDS,
+                "filters": [
+                    {"type": 5, "operator": "equal", "value": 10},
+                    {"type": 2, "operator": "equal", "value": "user:20"}
                 ]
             }
-            
-            projects = await api_client.get_projects()
-            
-            assert len(projects) == 1
-            assert projects[0].id == 456
-            assert projects[0].name == "Project 1"
-            assert projects[0].task_count == 5
-    
-    @pytest.mark.asyncio
-    async def test_add_contact(self, api_client):
-        """Test adding contact."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"id": 789}
-            
-            contact = await api_client.add_contact(
-                name="Test Contact",
-                email="test@example.com",
-                phone="+7-999-123-45-67",
-                company="Company",
-                position="Manager"
-            )
-            
-            assert contact.id == 789
-            assert contact.name == "Test Contact"
-            assert contact.email == "test@example.com"
-    
-    @pytest.mark.asyncio
-    async def test_get_analytics_report(self, api_client):
-        """Test getting analytics report."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {
-                "data": [{"name": "User 1", "value": "40h"}],
-                "summary": {"total": "40h"}
+        )
+    
+    async def test_list_tasks_invalid_response(self, api_client, mock_request):
+        """Test a non-list tasks value is rejected."""
+        mock_request.return_value = {"tasks": {"id": 123}}
+        
+        with pytest.raises(PlanfixValidationError, match="Expected 'tasks' to be a list"):
+            await api_client.list_tasks()
+    
+    async def test_list_projects(self, api_client, mock_request):
+        """Test listing projects."""
+        mock_request.return_value = {
+            "projects": [
+                {"id": 456, "name": "Project 1", "owner": {"id": "user:1", "name": "Руководитель"}},
+                {"id": 457, "name": "Project 2"}
+            ]
+        }
+        
+        projects = await api_client.list_projects(limit=2)
+        
+        assert [project.name for project in projects] == ["Project 1", "Project 2"]
+        assert projects[0].owner.name == "Руководитель"
+        
+        args, kwargs = mock_request.call_args
+        assert args == ("POST", "project/list")
+        assert kwargs["data"]["pageSize"] == 2
+    
+    async def test_list_contacts(self, api_client, mock_request):
+        """Test listing companies among contacts."""
+        mock_request.return_value = {
+            "contacts": [{"id": 789, "name": "Test Company", "isCompany": True}]
+        }
+        
+        contacts = await api_client.list_contacts(limit=10, offset=20, is_company=True)
+        
+        assert contacts[0].id == 789
+        assert contacts[0].isCompany is True
+        
+        args, kwargs = mock_request.call_args
+        assert args == ("POST", "contact/list")
+        assert kwargs["data"]["offset"] == 20
+        assert kwargs["data"]["pageSize"] == 10
+        assert kwargs["data"]["isCompany"] is True
+    
+    @pytest.mark.parametrize("fields, expected_fields", [
+        pytest.param(None, None, id="all_fields"),
+        pytest.param("id,name", "id,name", id="string"),
+        pytest.param(["id", "email"], "id,email", id="list"),
+    ])
+    async def test_get_contact_details(self, api_client, mock_request, fields, expected_fields):
+        """Test contact details request the default or selected fields."""
+        mock_request.return_value = {
+            "contact": {
+                "id": 789,
+                "name": "Test Contact",
+                "email": "test@example.com",
+                "phones": [{"number": "+7-999-123-45-67", "type": 1}]
             }
-            
-            report = await api_client.get_analytics_report(
-                report_type="time",
-                date_from="2024-01-01",
-                date_to="2024-01-31",
-                group_by="user"
-            )
-            
-            assert report["report_type"] == "time"
-            assert report["period"] == "2024-01-01 - 2024-01-31"
-            assert len(report["data"]) == 1
-    
-    @pytest.mark.asyncio
-    async def test_request_auth_error(self, api_client):
-        """Test authentication error handling."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_response.text = "Unauthorized"
-            
-            mock_client_instance = AsyncMock()
-            mock_client_instance.request.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            
-            with pytest.raises(PlanfixAuthError):
-                await api_client._request("GET", "test")
-    
-    @pytest.mark.asyncio
-    async def test_request_not_found_error(self, api_client):
-        """Test not found error handling."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.text = "Not Found"
-            
-            mock_client_instance = AsyncMock()
-            mock_client_instance.request.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            
-            with pytest.raises(PlanfixNotFoundError):
-                await api_client._request("GET", "test")
-    
-    @pytest.mark.asyncio
-    async def test_request_timeout_error(self, api_client):
-        """Test timeout error handling."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.request.side_effect = httpx.TimeoutException("Timeout")
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            
-            with pytest.raises(PlanfixError, match="Превышено время ожидания"):
-                await api_client._request("GET", "test")
-    
-    @pytest.mark.asyncio
-    async def test_request_connection_error(self, api_client):
-        """Test connection error handling."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.request.side_effect = httpx.ConnectError("Connection failed")
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            
-            with pytest.raises(PlanfixError, match="Не удалось подключиться"):
-                await api_client._request("GET", "test")
-    
-    @pytest.mark.asyncio
-    async def test_test_connection_success(self, api_client):
+        }
+        
+        contact = await api_client.get_contact_details(789, fields)
+        
+        assert contact.email == "test@example.com"
+        assert contact.phones[0].number == "+7-999-123-45-67"
+        
+        args, kwargs = mock_request.call_args
+        assert args == ("GET", "contact/789")
+        requested = kwargs["params"]["fields"]
+        if expected_fields is None:
+            assert_contains_all(requested, ("phones", "companies", "dataTags"))
+        else:
+            assert requested == expected_fields
+    
+    @pytest.mark.parametrize("outcome, expected_error, match", [
+        pytest.param(401, PlanfixAuthError, "Неверные учётные данные", id="auth"),
+        pytest.param(403, PlanfixAuthError, "Недостаточно прав", id="forbidden"),
+        pytest.param(404, PlanfixNotFoundError, "Ресурс не найден", id="not_found"),
+        pytest.param(500, PlanfixError, "HTTP 500: Error", id="server_error"),
+        pytest.param(httpx.TimeoutException("Timeout"), PlanfixError, "Превышено время ожидания", id="timeout"),
+        pytest.param(httpx.ConnectError("Connection failed"), PlanfixError, "Не удалось подключиться", id="connection"),
+    ])
+    async def test_request_error(self, api_client, http_client, outcome, expected_error, match):
+        """Test mapping of HTTP error statuses and transport errors."""
+        if isinstance(outcome, int):
+            http_client.request.return_value = httpx.Response(outcome, text="Error")
+        else:
+            http_client.request.side_effect = outcome
+        
+        with pytest.raises(expected_error, match=match):
+            await api_client._request("GET", "test")
+    
+    async def test_test_connection_success(self, api_client, mock_request):
         """Test successful connection test."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.return_value = {"account": "test"}
-            
-            result = await api_client.test_connection()
-            
-            assert result is True
-            mock_request.assert_called_once_with("GET", "account/info")
-    
-    @pytest.mark.asyncio
-    async def test_test_connection_failure(self, api_client):
+        mock_request.return_value = {"account": "test"}
+        
+        result = await api_client.test_connection()
+        
+        assert result is True
+        mock_request.assert_called_once_with("POST", "contact/list", data={"pageSize": 1})
+    
+    async def test_test_connection_failure(self, api_client, mock_request):
         """Test failed connection test."""
-        with patch.object(api_client, '_request') as mock_request:
-            mock_request.side_effect = PlanfixError("Connection failed")
-            
-            result = await api_client.test_connection()
-            
-            assert result is False
\ No newline at end of file
+        mock_request.side_effect = PlanfixError("Connection failed")
+        
+        result = await api_client.test_connection()
+        
+        assert result is False
\ No newline at end of file
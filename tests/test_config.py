@@ -1,181 +1,80 @@
 """Tests for configuration management."""
 
-import os
 import pytest
-from unittest.mock import patch
 from pydantic import ValidationError
 
+import src.config as config_module
 from src.config import PlanfixConfig, get_config
 
 
+CREDENTIALS = {
+    "planfix_account": "test-account",
+    "planfix_api_key": "test-api-key",
+}
+
+DEFAULTS = {
+    "planfix_account": None,
+    "planfix_api_key": None,
+    "request_timeout": 30,
+    "debug": False,
+}
+
+
 class TestPlanfixConfig:
     """Test Planfix configuration class."""
     
-    def test_config_with_all_required_fields(self):
-        """Test config creation with all required fields."""
-        config = PlanfixConfig(
-            planfix_account="test-account",
-            planfix_api_key="test-api-key",
-            planfix_user_key="test-user-key"
-        )
-        
-        assert config.planfix_account == "test-account"
-        assert config.planfix_api_key == "test-api-key"
-        assert config.planfix_user_key == "test-user-key"
-        assert config.planfix_base_url == "https://test-account.planfix.ru"
-        assert config.request_timeout == 30
-        assert config.debug is False
-    
-    def test_config_with_custom_base_url(self):
-        """Test config with custom base URL."""
-        config = PlanfixConfig(
-            planfix_account="test-account",
-            planfix_api_key="test-api-key",
-            planfix_user_key="test-user-key",
-            planfix_base_url="https://custom.planfix.ru/"
-        )
-        
-        assert config.planfix_base_url == "https://custom.planfix.ru"
-    
-    def test_config_with_optional_fields(self):
-        """Test config with optional fields."""
-        config = PlanfixConfig(
-            planfix_account="test-account",
-            planfix_api_key="test-api-key",
-            planfix_user_key="test-user-key",
-            request_timeout=60,
-            debug=True
-        )
+    @pytest.mark.parametrize("kwargs, expected", [
+        pytest.param({}, DEFAULTS, id="defaults"),
+        pytest.param(CREDENTIALS, {**DEFAULTS, **CREDENTIALS}, id="credentials"),
+        pytest.param(
+            {**CREDENTIALS, "request_timeout": "60", "debug": "true"},
+            {"request_timeout": 60, "debug": True},
+            id="coerces_optional_fields",
+        ),
+        pytest.param(
+            {**CREDENTIALS, "planfix_user_key": "test-user-key"},
+            {"planfix_user_key": "test-user-key"},
+            id="keeps_extra_fields",
+        ),
+    ])
+    def test_config_valid(self, kwargs, expected):
+        """Test config creation from valid settings."""
+        config = PlanfixConfig(**kwargs)
         
-        assert config.request_timeout == 60
-        assert config.debug is True
+        for field, value in expected.items():
+            assert getattr(config, field) == value
     
-    def test_config_missing_account(self):
-        """Test config validation with missing account."""
+    @pytest.mark.parametrize("kwargs, needle", [
+        pytest.param({"planfix_account": 123}, "planfix_account", id="non_string_account"),
+        pytest.param({"planfix_api_key": ["key"]}, "planfix_api_key", id="non_string_api_key"),
+        pytest.param({"request_timeout": "soon"}, "request_timeout", id="non_integer_timeout"),
+        pytest.param({"debug": "maybe"}, "debug", id="non_boolean_debug"),
+    ])
+    def test_config_validation_errors(self, kwargs, needle):
+        """Test config rejects values of the wrong type."""
         with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_api_key="test-api-key",
-                planfix_user_key="test-user-key"
-            )
+            PlanfixConfig(**kwargs)
         
-        assert "planfix_account" in str(excinfo.value)
-    
-    def test_config_empty_account(self):
-        """Test config validation with empty account."""
-        with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_account="",
-                planfix_api_key="test-api-key",
-                planfix_user_key="test-user-key"
-            )
-        
-        assert "PLANFIX_ACCOUNT" in str(excinfo.value)
-    
-    def test_config_missing_api_key(self):
-        """Test config validation with missing API key."""
-        with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_account="test-account",
-                planfix_user_key="test-user-key"
-            )
-        
-        assert "planfix_api_key" in str(excinfo.value)
-    
-    def test_config_empty_api_key(self):
-        """Test config validation with empty API key."""
-        with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_account="test-account",
-                planfix_api_key="",
-                planfix_user_key="test-user-key"
-            )
-        
-        assert "PLANFIX_API_KEY" in str(excinfo.value)
-    
-    def test_config_missing_user_key(self):
-        """Test config validation with missing user key."""
-        with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_account="test-account",
-                planfix_api_key="test-api-key"
-            )
-        
-        assert "planfix_user_key" in str(excinfo.value)
-    
-    def test_config_empty_user_key(self):
-        """Test config validation with empty user key."""
-        with pytest.raises(ValidationError) as excinfo:
-            PlanfixConfig(
-                planfix_account="test-account",
-                planfix_api_key="test-api-key",
-                planfix_user_key=""
-            )
-        
-        assert "PLANFIX_USER_KEY" in str(excinfo.value)
-    
-    def test_config_strips_whitespace(self):
-        """Test that config strips whitespace from credentials."""
-        config = PlanfixConfig(
-            planfix_account="  test-account  ",
-            planfix_api_key="  test-api-key  ",
-            planfix_user_key="  test-user-key  "
-        )
-        
-        assert config.planfix_account == "test-account"
-        assert config.planfix_api_key == "test-api-key"
-        assert config.planfix_user_key == "test-user-key"
+        assert needle in str(excinfo.value)
 
 
 class TestGetConfig:
     """Test get_config function."""
     
-    @patch.dict(os.environ, {
-        'PLANFIX_ACCOUNT': 'env-account',
-        'PLANFIX_API_KEY': 'env-api-key',
-        'PLANFIX_USER_KEY': 'env-user-key'
-    })
-    def test_get_config_from_env(self):
-        """Test getting config from environment variables."""
-        with patch('src.config.load_dotenv'):
-            config = get_config()
-            
-            assert config.planfix_account == "env-account"
-            assert config.planfix_api_key == "env-api-key"
-            assert config.planfix_user_key == "env-user-key"
-    
-    @patch.dict(os.environ, {
-        'PLANFIX_ACCOUNT': 'env-account',
-        'PLANFIX_API_KEY': 'env-api-key',
-        'PLANFIX_USER_KEY': 'env-user-key',
-        'DEBUG': 'true',
-        'REQUEST_TIMEOUT': '45'
-    })
-    def test_get_config_with_optional_env(self):
-        """Test getting config with optional environment variables."""
-        with patch('src.config.load_dotenv'):
-            config = get_config()
-            
-            assert config.debug is True
-            assert config.request_timeout == 45
-    
-    @patch.dict(os.environ, {}, clear=True)
-    def test_get_config_missing_required_env(self):
-        """Test get_config with missing required environment variables."""
-        with patch('src.config.load_dotenv'):
-            with pytest.raises(RuntimeError) as excinfo:
-                get_config()
-            
-            assert "Failed to load configuration" in str(excinfo.value)
+    def test_get_config_returns_defaults(self, monkeypatch):
+        """Test get_config builds a default config without reading PLANFIX_* variables."""
+        monkeypatch.setenv("PLANFIX_ACCOUNT", "env-account")
+        monkeypatch.setenv("REQUEST_TIMEOUT", "45")
+        
+        config = get_config()
+        
+        assert isinstance(config, PlanfixConfig)
+        assert config.model_dump() == DEFAULTS
     
-    @patch.dict(os.environ, {
-        'PLANFIX_ACCOUNT': 'env-account',
-        'PLANFIX_API_KEY': 'env-api-key',
-        'PLANFIX_USER_KEY': 'env-user-key',
-        'PLANFIX_BASE_URL': 'https://custom.example.com'
-    })
-    def test_get_config_with_custom_base_url(self):
-        """Test getting config with custom base URL."""
-        with patch('src.config.load_dotenv'):
-            config = get_config()
-            
-            assert config.planfix_base_url == "https://custom.example.com"
\ No newline at end of file
+    def test_get_config_returns_new_instance(self):
+        """Test each call returns a fresh config, separate from the module-level one."""
+        config = get_config()
+        
+        assert config is not get_config()
+        assert config is not config_module.config
+        assert isinstance(config_module.config, PlanfixConfig)
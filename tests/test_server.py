@@ -1,312 +1,239 @@
 """Tests for Planfix MCP Server."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
-from datetime import datetime
-
-# Import server functions (we'll need to adjust imports based on actual structure)
-with patch.dict('sys.modules', {'src.planfix_api': Mock()}):
-    from src.planfix_server import (
-        create_task, search_tasks, update_task_status, add_task_comment,
-        create_project, add_contact, get_analytics_report,
-        get_dashboard_summary, get_projects_list, get_task_details,
-        analyze_project_status, create_weekly_report, plan_sprint
-    )
+from types import SimpleNamespace
+from unittest.mock import call
+
+# The real API client does no I/O on construction, so the server module can
+# be imported as is; tests swap its client through patched_api
+import src.planfix_server as planfix_server
+from src.planfix_api import PlanfixError, PlanfixValidationError
+from src.planfix_server import (
+    DASHBOARD_CACHE_TTL, ListRequest, paginated_result, tool_errors,
+    list_tasks, list_contacts, get_contact_details,
+    get_dashboard_summary, get_projects_list, get_task_details, get_recent_contacts,
+    analyze_project_status, create_weekly_report, plan_sprint
+)
+
+from tests.fakes import FakeTask, SAMPLE_TASK_FILTERS, assert_contains_all
+
+
+@pytest.fixture
+def patched_api(mock_api):
+    """Install mock_api as the server's API client for one test."""
+    original = planfix_server.api
+    planfix_server.api = mock_api
+    planfix_server.reset_dashboard_cache()
+    yield mock_api
+    planfix_server.api = original
+    planfix_server.reset_dashboard_cache()
+
+
+class TestToolHelpers:
+    """Test helpers shared by the MCP tools."""
+
+    @pytest.mark.parametrize("error, expected", [
+        pytest.param(PlanfixValidationError("Поле 'limit': too big"), "Поле 'limit': too big", id="validation"),
+        pytest.param(PlanfixError("API Error"), "Error in проверке: PlanfixError: API Error", id="planfix"),
+        pytest.param(RuntimeError("boom"), "Error in проверке: RuntimeError: boom", id="unexpected"),
+    ])
+    async def test_tool_errors(self, error, expected):
+        """Test validation errors come back as text and others through format_error."""
+        @tool_errors("проверке")
+        async def tool() -> str:
+            raise error
+
+        assert await tool() == expected
+
+    @pytest.mark.parametrize("filter_str, expected", [
+        pytest.param("", "[]\n\nВсего найдено: 0 задач(и)", id="no_filter"),
+        pytest.param(" для задачи 5", "[]\n\nВсего найдено: 0 задач(и) для задачи 5", id="with_filter"),
+    ])
+    def test_paginated_result_empty(self, filter_str, expected):
+        """Test an empty page renders only the zero-count footer."""
+        assert paginated_result([], ListRequest(), "задач(и)", filter_str) == expected
+
 
 class TestMCPTools:
     """Test MCP tool functions."""
-    
-    @pytest.mark.asyncio
-    async def test_create_task_success(self, mock_api, sample_task_data):
-        """Test successful task creation."""
-        with patch('src.planfix_server.api', mock_api):
-            # Mock context
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            mock_ctx.error = Mock()
-            
-            result = await create_task(
-                name=sample_task_data["name"],
-                description=sample_task_data["description"],
-                priority=sample_task_data["priority"],
-                deadline=sample_task_data["deadline"],
-                ctx=mock_ctx
-            )
-            
-            assert "✅ **Задача создана успешно!**" in result
-            assert "Test Task" in result
-            assert "123" in result
-            
-            mock_ctx.info.assert_called()
-            mock_api.create_task.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_create_task_with_project_and_assignee(self, mock_api):
-        """Test task creation with project and assignee."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await create_task(
-                name="Project Task",
-                project_id=10,
-                assignee_id=20,
-                ctx=mock_ctx
-            )
-            
-            assert "Проект: ID 10" in result
-            assert "Исполнитель: ID 20" in result
-            
-            mock_api.create_task.assert_called_once_with(
-                name="Project Task",
-                description="",
-                project_id=10,
-                assignee_id=20,
-                priority="NORMAL",
-                deadline=None
-            )
-    
-    @pytest.mark.asyncio
-    async def test_create_task_error(self, mock_api):
-        """Test task creation error handling."""
-        with patch('src.planfix_server.api', mock_api):
-            from src.planfix_api import PlanfixError
-            mock_api.create_task.side_effect = PlanfixError("API Error")
-            
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            mock_ctx.error = Mock()
-            
-            result = await create_task(
-                name="Error Task",
-                ctx=mock_ctx
-            )
-            
-            assert "❌" in result
-            assert "ошибка" in result.lower()
-            mock_ctx.error.assert_called()
-    
-    @pytest.mark.asyncio
-    async def test_search_tasks_success(self, mock_api):
-        """Test successful task search."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await search_tasks(
-                query="test",
-                status="active",
-                ctx=mock_ctx
-            )
-            
-            assert "📋 Найдено задач: 2" in result
-            assert "Test Task 1" in result
-            assert "Test Task 2" in result
-            
-            mock_api.search_tasks.assert_called_once_with(
-                query="test",
-                project_id=None,
-                assignee_id=None,
-                status="active"
-            )
-    
-    @pytest.mark.asyncio
-    async def test_search_tasks_with_limit(self, mock_api):
-        """Test task search with limit."""
-        with patch('src.planfix_server.api', mock_api):
-            # Create more tasks than limit
-            mock_api.search_tasks.return_value = [Mock()] * 25
-            
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await search_tasks(
-                query="many",
-                limit=10,
-                ctx=mock_ctx
-            )
-            
-            assert "Показаны первые 10 результатов" in result
-    
-    @pytest.mark.asyncio
-    async def test_update_task_status_success(self, mock_api):
-        """Test successful status update."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await update_task_status(
-                task_id=123,
-                status="COMPLETED",
-                comment="All done!",
-                ctx=mock_ctx
-            )
-            
-            assert "✅ **Статус задачи обновлён!**" in result
-            assert "123" in result
-            assert "COMPLETED" in result
-            assert "All done!" in result
-            
-            mock_api.update_task_status.assert_called_once_with(
-                123, "COMPLETED", "All done!"
-            )
-    
-    @pytest.mark.asyncio
-    async def test_add_task_comment_success(self, mock_api):
-        """Test adding task comment."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await add_task_comment(
-                task_id=123,
-                comment="Great progress!",
-                ctx=mock_ctx
-            )
-            
-            assert "✅ **Комментарий добавлен!**" in result
-            assert "123" in result
-            assert "Great progress!" in result
-    
-    @pytest.mark.asyncio
-    async def test_create_project_success(self, mock_api, sample_project_data):
-        """Test successful project creation."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await create_project(
-                name=sample_project_data["name"],
-                description=sample_project_data["description"],
-                owner_id=sample_project_data["owner_id"],
-                client_id=sample_project_data["client_id"],
-                ctx=mock_ctx
-            )
-            
-            assert "✅ **Проект создан успешно!**" in result
-            assert "Test Project" in result
-            assert "456" in result
-    
-    @pytest.mark.asyncio
-    async def test_add_contact_success(self, mock_api, sample_contact_data):
-        """Test successful contact addition."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await add_contact(
-                name=sample_contact_data["name"],
-                email=sample_contact_data["email"],
-                phone=sample_contact_data["phone"],
-                company=sample_contact_data["company"],
-                position=sample_contact_data["position"],
-                ctx=mock_ctx
-            )
-            
-            assert "✅ **Контакт добавлен успешно!**" in result
-            assert "Test Contact" in result
-            assert "test@example.com" in result
-    
-    @pytest.mark.asyncio
-    async def test_get_analytics_report_success(self, mock_api):
-        """Test getting analytics report."""
-        with patch('src.planfix_server.api', mock_api):
-            mock_ctx = Mock()
-            mock_ctx.info = Mock()
-            
-            result = await get_analytics_report(
-                report_type="time",
-                period_start="2024-01-01",
-                period_end="2024-01-31",
-                group_by="user",
-                ctx=mock_ctx
-            )
-            
-            assert "📊 **TIME**" in result
-            assert "2024-01-01 - 2024-01-31" in result
-            assert "Иван Петров" in result
-            assert "40 часов" in result
+
+    @pytest.mark.parametrize("tool, kwargs, expected, api_call", [
+        pytest.param(
+            list_tasks,
+            dict(SAMPLE_TASK_FILTERS),
+            ['"Test Task 1"', '"Test Task 2"', "Всего найдено: 2 задач(и)"],
+            ("list_tasks", call(project_id=10, assignee_id=20, status="active", limit=20, offset=0)),
+            id="list_tasks",
+        ),
+        pytest.param(
+            list_contacts,
+            {"limit": 5, "is_company": True},
+            ['"Test Contact 1"', '"Test Contact 2"', "Всего найдено: 2 контакт(ов)"],
+            ("list_contacts", call(limit=5, offset=0, is_company=True)),
+            id="list_contacts",
+        ),
+        pytest.param(
+            get_contact_details,
+            {"contact_id": 789},
+            [
+                "Контакт #789",
+                "Имя: Test Contact",
+                "Email: test@example.com",
+                "Телефон: +7-999-123-45-67",
+                "Компания: Test Company",
+                "Должность: Manager",
+            ],
+            None,
+            id="get_contact_details",
+        ),
+    ])
+    async def test_tool_success(self, patched_api, tool, kwargs, expected, api_call):
+        """Test successful tool calls render the API result."""
+        result = await tool(**kwargs)
+
+        assert_contains_all(result, expected)
+
+        if api_call is not None:
+            method_name, expected_call = api_call
+            getattr(patched_api, method_name).assert_called_once_with(*expected_call.args, **expected_call.kwargs)
+
+    async def test_list_tasks_full_page(self, patched_api):
+        """Test a full page of tasks points to the next page."""
+        patched_api.list_tasks.return_value = [FakeTask(id=i, name=f"Task {i}") for i in range(1, 11)]
+
+        result = await list_tasks(page=2, limit=10)
+
+        assert "Показаны 10 результатов (лимит: 10), страница 2" in result
+        assert patched_api.list_tasks.call_args.kwargs["offset"] == 10
+
+    async def test_list_tasks_invalid_status(self, patched_api):
+        """Test an unknown status is rejected before calling the API."""
+        result = await list_tasks(status="archived")
+
+        assert "Status must be one of: active, completed, all" in result
+        patched_api.list_tasks.assert_not_called()
+
+    async def test_list_tasks_error(self, patched_api):
+        """Test task list error handling."""
+        patched_api.list_tasks.side_effect = PlanfixError("API Error")
+
+        result = await list_tasks()
+
+        assert result == "Error in поиске задач: PlanfixError: API Error"
 
 
 class TestMCPResources:
     """Test MCP resource functions."""
-    
-    @pytest.mark.asyncio
-    async def test_get_dashboard_summary(self, mock_api):
+
+    async def test_get_dashboard_summary(self, patched_api):
         """Test dashboard summary resource."""
-        with patch('src.planfix_server.api', mock_api):
-            result = await get_dashboard_summary()
-            
-            assert "📊 **Сводка Planfix**" in result
-            assert "📋 **ЗАДАЧИ:**" in result
-            assert "🎯 **ПРОЕКТЫ:**" in result
-            assert "📈 **АКТИВНОСТЬ:**" in result
-    
-    @pytest.mark.asyncio
-    async def test_get_projects_list(self, mock_api):
+        result = await get_dashboard_summary()
+
+        assert_contains_all(result, (
+            "Сводка Planfix на",
+            "ЗАДАЧИ:\n- Активные: 2",
+            "ПРОЕКТЫ:\n- Всего проектов: 2\n- Активные: 1",
+            "АКТИВНОСТЬ:",
+        ))
+        patched_api.list_tasks.assert_called_once_with(status="active")
+
+    @pytest.mark.parametrize("elapsed, api_calls", [
+        pytest.param(DASHBOARD_CACHE_TTL - 0.1, 1, id="hit"),
+        pytest.param(DASHBOARD_CACHE_TTL + 0.1, 2, id="miss"),
+    ])
+    async def test_get_dashboard_summary_cache(self, patched_api, monkeypatch, elapsed, api_calls):
+        """Test the summary is reused within DASHBOARD_CACHE_TTL and refetched after it."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(planfix_server, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+        first = await get_dashboard_summary()
+        clock.now += elapsed
+        second = await get_dashboard_summary()
+
+        assert patched_api.list_tasks.call_count == api_calls
+        assert (second is first) == (api_calls == 1)
+
+    async def test_get_projects_list(self, patched_api):
         """Test projects list resource."""
-        with patch('src.planfix_server.api', mock_api):
-            result = await get_projects_list()
-            
-            assert "🎯 **Проекты**" in result
-            assert "Test Project 1" in result
-            assert "Test Project 2" in result
-    
-    @pytest.mark.asyncio
-    async def test_get_task_details_success(self, mock_api):
+        result = await get_projects_list()
+
+        assert_contains_all(result, (
+            "Проекты (2 шт.)",
+            "1. Test Project 1 (#456)\n- Статус: Активный\n- Владелец: Руководитель\n- Задач: 5",
+            "2. Test Project 2 (#457)",
+        ))
+
+    async def test_get_task_details_success(self, patched_api):
         """Test task details resource."""
-        with patch('src.planfix_server.api', mock_api):
-            result = await get_task_details("123")
-            
-            assert "📋 **Задача #123**" in result
-            assert "Test Task" in result
-            assert "В работе" in result
-            assert "Иван Петров" in result
-    
-    @pytest.mark.asyncio
-    async def test_get_task_details_invalid_id(self, mock_api):
+        result = await get_task_details("123")
+
+        assert_contains_all(result, (
+            "Задача #123",
+            "Название: Test Task",
+            "Статус: В работе",
+            "Исполнитель: Иван Петров",
+            "Срок: 2024-12-31",
+        ))
+
+    async def test_get_task_details_invalid_id(self, patched_api):
         """Test task details with invalid ID."""
-        with patch('src.planfix_server.api', mock_api):
-            result = await get_task_details("invalid")
-            
-            assert "❌ Неверный ID задачи" in result
+        result = await get_task_details("invalid")
+
+        assert result == "Неверный ID задачи: invalid"
+
+    async def test_get_recent_contacts(self, patched_api):
+        """Test recent contacts resource."""
+        result = await get_recent_contacts()
+
+        assert_contains_all(result, (
+            "Недавние контакты (2 шт.)",
+            "1. Test Contact 1 (#789)\n- Email: contact1@example.com\n- Должность: Manager",
+            "2. Test Contact 2 (#790)",
+        ))
+        patched_api.list_contacts.assert_called_once_with(limit=10)
 
 
 class TestMCPPrompts:
     """Test MCP prompt functions."""
-    
+
     def test_analyze_project_status_prompt(self):
         """Test project analysis prompt."""
         result = analyze_project_status("Test Project")
-        
-        assert "Test Project" in result
-        assert "🔍 **АНАЛИЗ ПРОЕКТА:**" in result
-        assert "📊 **МЕТРИКИ ДЛЯ ОЦЕНКИ:**" in result
-        assert "⚠️ **ОСОБОЕ ВНИМАНИЕ:**" in result
-        assert "📋 **РЕЗУЛЬТАТ:**" in result
-    
+
+        assert_contains_all(result, (
+            '"Test Project"',
+            "🔍 **АНАЛИЗ ПРОЕКТА:**",
+            "МЕТРИКИ ДЛЯ ОЦЕНКИ:",
+            "ОСОБОЕ ВНИМАНИЕ:",
+            "РЕЗУЛЬТАТ:",
+        ))
+
     def test_create_weekly_report_prompt(self):
         """Test weekly report prompt."""
         result = create_weekly_report("2024-01-01")
-        
-        assert "2024-01-01 - 2024-01-07" in result
-        assert "📊 **ПОКАЗАТЕЛИ НЕДЕЛИ:**" in result
-        assert "🎯 **ДОСТИЖЕНИЯ:**" in result
-        assert "⚠️ **ПРОБЛЕМЫ И РИСКИ:**" in result
-        assert "📋 **ПЛАНЫ НА СЛЕДУЮЩУЮ НЕДЕЛЮ:**" in result
-    
+
+        assert_contains_all(result, (
+            "2024-01-01 - 2024-01-07",
+            "ПОКАЗАТЕЛИ НЕДЕЛИ:",
+            "ДОСТИЖЕНИЯ:",
+            "ПРОБЛЕМЫ И РИСКИ:",
+            "ПЛАНЫ НА СЛЕДУЮЩУЮ НЕДЕЛЮ:",
+        ))
+
     def test_plan_sprint_prompt(self):
         """Test sprint planning prompt."""
         result = plan_sprint(14)
-        
-        assert "14 дней" in result
-        assert "🎯 **ЦЕЛИ СПРИНТА:**" in result
-        assert "📋 **ПЛАНИРОВАНИЕ ЗАДАЧ:**" in result
-        assert "⏰ **ВРЕМЕННОЕ ПЛАНИРОВАНИЕ:**" in result
-        assert "🎯 **ИТОГОВЫЙ ПЛАН:**" in result
-    
+
+        assert_contains_all(result, (
+            "14 дней",
+            "ЦЕЛИ СПРИНТА:",
+            "ПЛАНИРОВАНИЕ ЗАДАЧ:",
+            "ВРЕМЕННОЕ ПЛАНИРОВАНИЕ:",
+            "ИТОГОВЫЙ ПЛАН:",
+        ))
+
     def test_plan_sprint_custom_duration(self):
         """Test sprint planning with custom duration."""
         result = plan_sprint(21)
-        
-        assert "21 дней" in result
\ No newline at end of file
+
+        assert "21 дней" in result